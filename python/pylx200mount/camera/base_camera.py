@@ -19,12 +19,10 @@ class BaseCamera(abc.ABC):
     @abc.abstractmethod
     async def open(self) -> None:
         """Open the camera."""
-        raise NotImplementedError
 
     @abc.abstractmethod
     async def start_imaging(self) -> None:
         """Close the camera."""
-        raise NotImplementedError
 
     @abc.abstractmethod
     async def get_image(self) -> np.ndarray:
@@ -35,9 +33,7 @@ class BaseCamera(abc.ABC):
         numpy.ndarray
             The image as a numpy array.
         """
-        raise NotImplementedError
 
     @abc.abstractmethod
     async def stop_imaging(self) -> None:
         """Close the camera."""
-        raise NotImplementedError
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 from astropy import units as u
 from astropy.coordinates import Angle, Latitude, Longitude
@@ -26,21 +27,151 @@ UPDATING_PLANETARY_DATA2 = "                              " + HASH
 # Separator used for multiple replies.
 REPLY_SEPARATOR = "\n"
 
+# Replies that never change.
+CLOCK_FORMAT_REPLY = "(24)" + HASH
+TRACKING_RATE_REPLY = "60.1" + HASH
+FIRMWARE_DATE_REPLY = "Apr 05 2020" + HASH
+FIRMWARE_TIME_REPLY = "18:00:00" + HASH
+FIRMWARE_NUMBER_REPLY = "01.0" + HASH
+FIRMWARE_NAME_REPLY = "Phidgets|A|43Eg|Apr 05 2020@18:00:00" + HASH
+TELESCOPE_NAME_REPLY = "Phidgets" + HASH
+ALIGNMENT_STATUS_REPLY = "AN0" + HASH
+
+
+def get_sexagesimal(
+    value: float, resolution: float
+) -> tuple[float, float, float, float]:
+    """Split a value in its sign and the whole, minutes and seconds parts of its
+    absolute value.
+
+    The absolute value first gets rounded to a multiple of the resolution, so the
+    rounding carries over into the minutes and whole parts like it does in
+    `Angle.to_string`.
+
+    Parameters
+    ----------
+    value : `float`
+        The value [deg or hour] to split.
+    resolution : `float`
+        The resolution [arcsec or sec] to round the value to.
+
+    Returns
+    -------
+    tuple[float, float, float, float]
+        The sign and the whole, minutes and seconds parts of the absolute value.
+    """
+    sign = -1.0 if value < 0.0 else 1.0
+    seconds = round(abs(value) * 3600.0 / resolution) * resolution
+    whole, seconds = divmod(seconds, 3600.0)
+    minutes, seconds = divmod(seconds, 60.0)
+    return sign, whole, minutes, seconds
+
 
 async def get_angle_as_lx200_string(
     angle: Angle, digits: int, coordinate_precision: CoordinatePrecision
 ) -> str:
-    # Use signed_dms here because dms will have negative minutes and seconds!!!
-    angle_dms = angle.signed_dms
-    d = f"{angle_dms.sign * angle_dms.d:0{digits}.0f}"
     if coordinate_precision == CoordinatePrecision.HIGH:
-        angle_str = f"{d}*{angle_dms.m:02.0f}'{angle_dms.s:02.0f}"
+        sign, degrees, minutes, seconds = get_sexagesimal(angle.deg, 1.0)
     else:
-        m = angle_dms.m + (angle_dms.s / 60.0)
-        angle_str = f"{d}*{m:02.0f}"
+        sign, degrees, minutes, seconds = get_sexagesimal(angle.deg, 60.0)
+    d = f"{'-' if sign < 0.0 else ''}{degrees:0{digits}.0f}"
+    if coordinate_precision == CoordinatePrecision.HIGH:
+        angle_str = f"{d}*{minutes:02.0f}'{seconds:02.0f}"
+    else:
+        angle_str = f"{d}*{minutes:02.0f}"
     return angle_str
 
 
+async def get_ra_as_lx200_string(
+    ra: Angle, coordinate_precision: CoordinatePrecision
+) -> str:
+    if coordinate_precision == CoordinatePrecision.HIGH:
+        _, hours, minutes, seconds = get_sexagesimal(ra.deg / 15.0, 1.0)
+    else:
+        # The minutes are sent with one decimal, which is a resolution of 6 seconds.
+        _, hours, minutes, seconds = get_sexagesimal(ra.deg / 15.0, 6.0)
+    # The rounding may carry over to 24h, which is not a valid RA.
+    hours %= 24.0
+    if coordinate_precision == CoordinatePrecision.HIGH:
+        ra_str = f"{hours:02.0f}:{minutes:02.0f}:{seconds:02.0f}"
+    else:
+        m = minutes + (seconds / 60.0)
+        ra_str = f"{hours:02.0f}:{m:04.1f}"
+    return ra_str
+
+
+def get_degrees_from_deg_min(data: str) -> float:
+    """Get the value in degrees of an angle in the form "deg*min".
+
+    Parameters
+    ----------
+    data : `str`
+        The angle in the form "deg*min", where the sign applies to the whole angle.
+
+    Returns
+    -------
+    float
+        The angle [deg].
+    """
+    deg_str, min_str = data.split("*")
+    degrees = abs(float(deg_str)) + float(min_str) / 60.0
+    return -degrees if deg_str.lstrip().startswith("-") else degrees
+
+
+@lru_cache(maxsize=8)
+def parse_lx200_latitude(data: str) -> Latitude:
+    """Parse the latitude as sent by an LX200 client.
+
+    Clients tend to send the same site latitude each time they connect, so the
+    parsed values are cached.
+
+    Parameters
+    ----------
+    data : `str`
+        The latitude as sent by the client.
+
+    Returns
+    -------
+    Latitude
+        The parsed latitude.
+    """
+    if "*" in data:
+        # SkySafari and AstroPlanner send the latitude in the form "deg*min".
+        return Latitude(get_degrees_from_deg_min(data), u.deg)
+    # INDI sends the latitude in the form of a decimal value.
+    return Latitude(f"{data} degrees")
+
+
+@lru_cache(maxsize=8)
+def parse_lx200_longitude(data: str) -> Longitude:
+    """Parse the longitude as sent by an LX200 client.
+
+    The LX200 protocol puts West longitudes positive while astropy puts East
+    longitude positive, so the sign gets flipped. Clients tend to send the same
+    site longitude each time they connect, so the parsed values are cached.
+
+    Parameters
+    ----------
+    data : `str`
+        The longitude as sent by the client.
+
+    Returns
+    -------
+    Longitude
+        The parsed longitude.
+    """
+    if data[0] == "-":
+        longitude = data[1:]
+    else:
+        longitude = "-" + data
+
+    if "*" in data:
+        # SkySafari and AstroPlanner send the longitude in the form "deg*min".
+        return Longitude(get_degrees_from_deg_min(longitude), u.deg)
+    # INDI sends the longitude in the form of a decimal value.
+    return Longitude(f"{longitude} degrees")
+
+
 class Lx200CommandResponder:
     """Implements the LX200 protocol.
 
@@ -114,6 +245,10 @@ class Lx200CommandResponder:
         # Keep track of the timezone, time and date, so it can be passed on to DatetimeUtil.
         self._datetime_str = ""
 
+        # The LX200 replies for the site latitude and longitude, which only change when they get set.
+        self._site_latitude_reply: str | None = None
+        self._site_longitude_reply: str | None = None
+
     async def start(self) -> None:
         """Start the responder."""
         self.log.info("Start called.")
@@ -127,13 +262,9 @@ class Lx200CommandResponder:
     async def get_ra(self) -> str:
         """Get the RA that the mount currently is pointing at."""
         ra_dec = await self.mount_controller.get_ra_dec()
-        ra = ra_dec.ra
-        hms = ra.hms
-        if self.coordinate_precision == CoordinatePrecision.HIGH:
-            ra_str = f"{hms.h:02.0f}:{hms.m:02.0f}:{hms.s:02.0f}"
-        else:
-            m = hms.m + (hms.s / 60.0)
-            ra_str = f"{hms.h:02.0f}:{m:02.1f}"
+        ra_str = await get_ra_as_lx200_string(
+            ra=ra_dec.ra, coordinate_precision=self.coordinate_precision
+        )
         return ra_str + HASH
 
     async def set_ra(self, data: str) -> str:
@@ -182,12 +313,12 @@ class Lx200CommandResponder:
 
     async def get_clock_format(self) -> str:
         """Get the clock format: 12h or 24h. We will always use 24h."""
-        return "(24)" + HASH
+        return CLOCK_FORMAT_REPLY
 
     async def get_tracking_rate(self) -> str:
         """Get the tracking rate of the mount."""
         # Return the sideral tracking frequency.
-        return "60.1" + HASH
+        return TRACKING_RATE_REPLY
 
     async def get_utc_offset(self) -> str:
         """Get the UTC offset of the obsering site.
@@ -196,69 +327,61 @@ class Lx200CommandResponder:
         of the number of hours that the local time is ahead or behind of UTC. The
         difference is a minus symbol.
         """
-        dt = DatetimeUtil.get_datetime()
-        tz_info = dt.tzinfo
-        assert tz_info is not None
-        utc_offset = tz_info.utcoffset(dt)
-        assert utc_offset is not None
+        # DatetimeUtil uses a fixed offset timezone, so no datetime is needed to get the UTC offset.
+        utc_offset = DatetimeUtil.tz.utcoffset(None)
         utc_offset_hours = -utc_offset.total_seconds() / 3600
-        self.log.debug(f"UTC Offset = {utc_offset_hours}")
+        self.log.debug("UTC Offset = %s", utc_offset_hours)
         return f"{utc_offset_hours:2.0f}" + HASH
 
     async def get_local_time(self) -> str:
         """Get the local time at the observing site."""
         current_dt = DatetimeUtil.get_datetime()
-        return current_dt.strftime("%H:%M:%S") + HASH
+        return f"{current_dt.hour:02d}:{current_dt.minute:02d}:{current_dt.second:02d}{HASH}"
 
     async def get_current_date(self) -> str:
         """Get the local date at the observing site."""
         current_dt = DatetimeUtil.get_datetime()
-        return current_dt.strftime("%m/%d/%y") + HASH
+        return f"{current_dt.month:02d}/{current_dt.day:02d}/{current_dt.year % 100:02d}{HASH}"
 
     async def get_firmware_date(self) -> str:
         """Get the firmware date which is just a date that I made up."""
-        return "Apr 05 2020" + HASH
+        return FIRMWARE_DATE_REPLY
 
     async def get_firmware_time(self) -> str:
         """Get the firmware time which is just a time that I made up."""
-        return "18:00:00" + HASH
+        return FIRMWARE_TIME_REPLY
 
     async def get_firmware_number(self) -> str:
         """Get the firmware number which is just a number that I made up."""
-        return "01.0" + HASH
+        return FIRMWARE_NUMBER_REPLY
 
     async def get_firmware_name(self) -> str:
         """Get the firmware name which is just a name that I made up."""
-        return "Phidgets|A|43Eg|Apr 05 2020@18:00:00" + HASH
+        return FIRMWARE_NAME_REPLY
 
     async def get_telescope_name(self) -> str:
         """Get the mount name which is just a name that I made up."""
-        return "Phidgets" + HASH
+        return TELESCOPE_NAME_REPLY
 
     async def get_current_site_latitude(self) -> str:
         """Get the latitude of the obsering site."""
-        lat = self.mount_controller.observing_location.location.lat
-        return (
-            await get_angle_as_lx200_string(
-                angle=lat, digits=2, coordinate_precision=CoordinatePrecision.LOW
+        if self._site_latitude_reply is None:
+            lat = self.mount_controller.observing_location.location.lat
+            self._site_latitude_reply = (
+                await get_angle_as_lx200_string(
+                    angle=lat, digits=2, coordinate_precision=CoordinatePrecision.LOW
+                )
+                + HASH
             )
-            + HASH
-        )
+        return self._site_latitude_reply
 
     async def set_current_site_latitude(self, data: str) -> str:
         """Set the latitude of the obsering site."""
         self.log.debug(f"set_current_site_latitude received data {data}")
-        if "*" in data:
-            # SkySafari and AstroPlanner send the latitude in the form "deg*min".
-            lat_deg, lat_min = data.split("*")
-            self.mount_controller.observing_location.set_latitude(
-                Latitude(f"{lat_deg}d{lat_min}m")
-            )
-        else:
-            # INDI sends the latitude in the form of a decimal value.
-            self.mount_controller.observing_location.set_latitude(
-                Latitude(f"{data} degrees")
-            )
+        self.mount_controller.observing_location.set_latitude(
+            parse_lx200_latitude(data)
+        )
+        self._site_latitude_reply = None
         await self.mount_controller.location_updated()
         return DEFAULT_REPLY
 
@@ -269,19 +392,18 @@ class Lx200CommandResponder:
         longitude positive, so we need to convert from the astropy longitude to the
         LX200 longitude.
         """
-        longitude = self.mount_controller.observing_location.location.lon.to_string(
-            unit=u.degree, sep=":", fields=2
-        )
-        if longitude[0] == "-":
-            longitude = longitude[1:]
-        else:
-            longitude = "-" + longitude
-        self.log.debug(
-            f"Converted internal longitude "
-            f"{self.mount_controller.observing_location.location.lon.to_string()} "
-            f"to LX200 longitude {longitude}"
-        )
-        return longitude + HASH
+        if self._site_longitude_reply is None:
+            lon = self.mount_controller.observing_location.location.lon
+            longitude = lon.to_string(unit=u.degree, sep=":", fields=2)
+            if longitude[0] == "-":
+                longitude = longitude[1:]
+            else:
+                longitude = "-" + longitude
+            self.log.debug(
+                "Converted internal longitude %s to LX200 longitude %s", lon, longitude
+            )
+            self._site_longitude_reply = longitude + HASH
+        return self._site_longitude_reply
 
     async def set_current_site_longitude(self, data: str) -> str:
         """Set the longitude of the obsering site.
@@ -291,25 +413,14 @@ class Lx200CommandResponder:
         astropy longitude.
         """
         self.log.debug(f"set_current_site_longitude received data {data}")
-        if data[0] == "-":
-            longitude = data[1:]
-        else:
-            longitude = "-" + data
-
-        if "*" in data:
-            # SkySafari and AstroPlanner send the longitude in the form "deg*min".
-            lon_deg, lon_min = longitude.split("*")
-            self.mount_controller.observing_location.set_longitude(
-                Latitude(f"{lon_deg}d{lon_min}m")
-            )
-        else:
-            # INDI sends the longitude in the form of a decimal value.
-            self.mount_controller.observing_location.set_longitude(
-                Longitude(f"{longitude} degrees")
-            )
+        self.mount_controller.observing_location.set_longitude(
+            parse_lx200_longitude(data)
+        )
+        self._site_longitude_reply = None
         self.log.debug(
-            f"Converted LX200 longitude {data} to internal longitude "
-            f"{self.mount_controller.observing_location.location.lon.to_string()}"
+            "Converted LX200 longitude %s to internal longitude %s",
+            data,
+            self.mount_controller.observing_location.location.lon,
         )
         await self.mount_controller.location_updated()
         return DEFAULT_REPLY
@@ -413,4 +524,4 @@ class Lx200CommandResponder:
 
     async def get_alignment_status(self) -> str:
         """Get the alignment status."""
-        return "AN0" + HASH
+        return ALIGNMENT_STATUS_REPLY
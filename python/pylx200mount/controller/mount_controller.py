@@ -82,6 +82,11 @@ class MountController:
         self.previous_mount_alt_az: SkyCoord = self.mount_alt_az
         self.camera_alt_az = self.mount_alt_az
 
+        # The RA and DEC of the last mount AltAz that was transformed, so the RA and DEC requests that are
+        # sent in pairs share one transformation.
+        self._ra_dec_alt_az: SkyCoord | None = None
+        self._ra_dec: SkyCoord | None = None
+
         # Slew related variables.
         self.slew_direction = SlewDirection.NONE
         self.slew_rate = SlewRate.HIGH
@@ -124,19 +129,24 @@ class MountController:
         )
         self.align_with_plate_solver = False
 
-    def _get_mount_alt_az(self) -> SkyCoord:
+    def _get_mount_alt_az(self, timestamp: float) -> SkyCoord:
         """Get the current motor positions as AltAz coordinates.
 
+        Parameters
+        ----------
+        timestamp : `float`
+            The timestamp of the current tick, so all coordinates computed in it share the same obstime.
+
         Returns
         -------
         `SkyCoord`
             The current motor positions as AltAz coordinates.
         """
         alt_az = get_skycoord_from_alt_az(
-            alt=self.motor_controller_alt.position.deg,
-            az=self.motor_controller_az.position.deg,
+            alt=self.motor_controller_alt.position_deg,
+            az=self.motor_controller_az.position_deg,
             observing_location=self.observing_location,
-            timestamp=DatetimeUtil.get_timestamp(),
+            timestamp=timestamp,
         )
         return alt_az
 
@@ -197,21 +207,21 @@ class MountController:
             else:
                 self.is_slewing = False
 
-            timediff = 2.0 * POSITION_INTERVAL
-            target_alt_az = get_altaz_at_different_time(
-                alt=self.motor_controller_alt.position.deg,
-                az=self.motor_controller_az.position.deg,
-                observing_location=self.observing_location,
-                timestamp=DatetimeUtil.get_timestamp(),
-                timediff=timediff,
-            )
-
             # Since the slew is performed to the AltAz at the end of the longest axis slew, tracking should
-            # only start as soon as both motors have switched to tracking.
+            # only start as soon as both motors have switched to tracking. The target AltAz is only needed
+            # then, so the coordinate transformation is skipped while the mount is stopped or slewing.
             if (
                 self.motor_controller_az.state == MotorControllerState.TRACKING
                 and self.motor_controller_alt.state == MotorControllerState.TRACKING
             ):
+                timediff = 2.0 * POSITION_INTERVAL
+                target_alt_az = get_altaz_at_different_time(
+                    alt=self.motor_controller_alt.position_deg,
+                    az=self.motor_controller_az.position_deg,
+                    observing_location=self.observing_location,
+                    timestamp=DatetimeUtil.get_timestamp(),
+                    timediff=timediff,
+                )
                 await self.motor_controller_az.track(target_alt_az.az, timediff)
                 await self.motor_controller_alt.track(target_alt_az.alt, timediff)
 
@@ -233,7 +243,7 @@ class MountController:
         motor : `BaseMotorController`
             The motor to check.
         """
-        if motor.state != MotorControllerState.STOPPED and motor.velocity == ZERO:
+        if motor.state != MotorControllerState.STOPPED and not motor.is_moving:
             motor.state = MotorControllerState.TRACKING
 
     async def stop(self) -> None:
@@ -276,8 +286,13 @@ class MountController:
                     assert self.plate_solver is not None
                     self.previous_mount_alt_az = self.mount_alt_az
                     camera_ra_dec = await self.plate_solver.solve()
-                    self.camera_alt_az = get_altaz_from_radec(
-                        camera_ra_dec, self.observing_location, now
+                    loop = asyncio.get_running_loop()
+                    self.camera_alt_az = await loop.run_in_executor(
+                        None,
+                        get_altaz_from_radec,
+                        camera_ra_dec,
+                        self.observing_location,
+                        now,
                     )
                     self.mount_alt_az = self.camera_alt_az.spherical_offsets_by(
                         self.camera_mount_offset[0], self.camera_mount_offset[1]
@@ -286,12 +301,12 @@ class MountController:
                     self.log.exception("Error solving.")
                     self.mount_alt_az = self.previous_mount_alt_az
             else:
-                mount_alt_az = self._get_mount_alt_az()
+                mount_alt_az = self._get_mount_alt_az(now)
                 self.mount_alt_az = self.alignment_handler.reverse_matrix_transform(
                     mount_alt_az, now
                 )
             end = DatetimeUtil.get_timestamp()
-            self.log.debug(f"Get mount AltAz took {end - now} s.")
+            self.log.debug("Get mount AltAz took %s s.", end - now)
 
             remainder = (
                 DatetimeUtil.get_timestamp() - start_time
@@ -306,14 +321,22 @@ class MountController:
         """Get the current RA and DEC of the mount.
 
         Since RA and DEC of the mount are requested in pairs, this method computes both
-        the RA and DEC.
+        the RA and DEC. The result is reused until the mount AltAz gets updated.
 
         Returns
         -------
         The right ascention and declination.
         """
-        ra_dec = get_radec_from_altaz(alt_az=self.mount_alt_az)
-        return ra_dec
+        if self._ra_dec is None or self._ra_dec_alt_az is not self.mount_alt_az:
+            # The transformation is CPU bound, so run it in a thread to not block the LX200 communication.
+            mount_alt_az = self.mount_alt_az
+            loop = asyncio.get_running_loop()
+            ra_dec = await loop.run_in_executor(
+                None, get_radec_from_altaz, mount_alt_az
+            )
+            self._ra_dec_alt_az = mount_alt_az
+            self._ra_dec = ra_dec
+        return self._ra_dec
 
     async def set_ra_dec(self, ra_str: str, dec_str: str) -> None:
         """Set the current RA and DEC of the mount.
@@ -351,7 +374,7 @@ class MountController:
         else:
             # Add an alignment point and compute the alignment matrix.
             self.alignment_handler.add_alignment_position(
-                sky_alt_az, self._get_mount_alt_az
+                sky_alt_az, self._get_mount_alt_az(now)
             )
 
             # Compute the mount AltAz from the sky AltAz and pass on to the motor controllers.
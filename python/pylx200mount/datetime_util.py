@@ -1,6 +1,7 @@
 __all__ = ["DatetimeUtil"]
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 
 dt = datetime.now().astimezone()
@@ -28,7 +29,8 @@ class DatetimeUtil:
         This takes both the timezone (either taken from the computer or set by the planetarium software) and
         the timedelta (taken from the time and date set by the planetarium software) into account.
 
-        Unit tests may replace this function for better time control.
+        Unit tests may replace this function for better time control. Note that `get_timestamp` doesn't use
+        this function, so unit tests that need to control timestamps should replace `get_timestamp` as well.
 
         Returns
         -------
@@ -41,12 +43,15 @@ class DatetimeUtil:
     def get_timestamp(cls) -> float:
         """Convenience method to retrieve the current time stamp.
 
+        A timestamp doesn't depend on the timezone, so this is computed directly from the system time and the
+        timedelta, without creating a timezone aware datetime first.
+
         Returns
         -------
         `float`
             The current timezone time as timestamp.
         """
-        return DatetimeUtil.get_datetime().timestamp()
+        return time.time() + DatetimeUtil.delta.total_seconds()
 
     @classmethod
     def set_datetime(cls, dt: datetime) -> None:
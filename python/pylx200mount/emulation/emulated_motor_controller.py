@@ -204,6 +204,8 @@ class EmulatedMotorController(BaseMotorController):
     See `BaseMotorController`.
     """
 
+    __slots__ = ("stepper",)
+
     def __init__(
         self,
         initial_position: Angle,
@@ -223,13 +225,10 @@ class EmulatedMotorController(BaseMotorController):
         self.stepper.set_on_position_change_handler(self.on_position_change)
         self.stepper.set_on_velocity_change_handler(self.on_velocity_change)
 
-        self._position_offset = round(
-            (initial_position / self._conversion_factor).value
-        )
+        self.position = initial_position
 
     async def connect(self) -> None:
         """Connect the stepper motor."""
-        assert self.stepper is not None
         try:
             self.stepper.open_wait_for_attachment(ATTACH_WAIT_TIME)
         except Exception as e:
@@ -241,7 +240,6 @@ class EmulatedMotorController(BaseMotorController):
 
     async def disconnect(self) -> None:
         """Disconnect the stepper motor."""
-        assert self.stepper is not None
         self.stepper.set_engaged(False)
         self.stepper.close()
         assert not self.attached
@@ -258,6 +256,5 @@ class EmulatedMotorController(BaseMotorController):
         max_velocity_in_steps : `float`
             The maximum velocity [steps/sec].
         """
-        assert self.stepper is not None
         self.stepper.set_velocity_limit(abs(max_velocity_in_steps))
         self.stepper.set_target_position(target_position_in_steps)
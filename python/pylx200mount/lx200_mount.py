@@ -23,6 +23,10 @@ EMPTY_REPLY = "A"
 # Sleep time between sending replies that contain a newline character.
 SEND_COMMAND_SLEEP = 0.01
 
+# The implemented commands by their value and the lengths of those values, to look up received commands.
+COMMANDS_BY_VALUE = {command.value: command for command in CommandName}
+COMMAND_LENGTHS = sorted({len(value) for value in COMMANDS_BY_VALUE}, reverse=True)
+
 
 class LX200Mount:
     def __init__(self, run_forever: bool = True) -> None:
@@ -114,39 +118,37 @@ class LX200Mount:
             self.log.debug(f"Read command line: {line!r}")
 
         # Almost all LX200 commands are unique but don't have a fixed length.
-        # So we simply loop over all implemented commands until we find
-        # the one that we have received. All the implemented commands are
-        # unique so this is a safe way to find the command without having to
-        # write too much boilerplate code.
-        cmd = ""
-        for key in CommandName:
-            if line.startswith(key.value):
+        # None of the implemented commands is the start of another one, so
+        # we simply look up the start of the line for each command length
+        # until we find the command that we have received.
+        for length in COMMAND_LENGTHS:
+            key = COMMANDS_BY_VALUE.get(line[:length])
+            if key is not None:
                 await self._process_command(key, line)
-                cmd = key.value
-                break
+                return
 
         # Log a message if the command wasn't found.
-        if cmd == "":
-            self.log.error(f"Unknown command {line!r}.")
+        self.log.error(f"Unknown command {line!r}.")
 
     async def _process_command(self, cmd: CommandName, line: str) -> None:
         self.responder.cmd = cmd.value
         (func, has_arg) = self.responder.dispatch_dict[cmd]
-        kwargs = {}
         if has_arg:
             # Read the function argument from the incoming command line
             # and pass it on to the function.
-            data_start = len(cmd.value)
-            kwargs["data"] = line[data_start:-1]
-        output = await func(**kwargs)  # type: ignore
-        if output:
-            # Dirty trick to be able to send two output
-            # strings as is expected for "SC#".
-            outputs = output.split(REPLY_SEPARATOR)
-            for i in range(len(outputs)):
-                await self.write(outputs[i])
-                if len(outputs) > 1:
-                    await asyncio.sleep(SEND_COMMAND_SLEEP)
+            output = await func(line[len(cmd.value) : -1])  # type: ignore
+        else:
+            output = await func()  # type: ignore
+        if not output:
+            return
+        if REPLY_SEPARATOR not in output:
+            await self.write(output)
+            return
+        # Dirty trick to be able to send two output
+        # strings as is expected for "SC#".
+        for reply in output.split(REPLY_SEPARATOR):
+            await self.write(reply)
+            await asyncio.sleep(SEND_COMMAND_SLEEP)
 
 
 async def run_lx200_mount() -> None:
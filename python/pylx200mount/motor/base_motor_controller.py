@@ -11,16 +11,16 @@ import astropy.units as u
 from astropy.coordinates import Angle
 
 from ..enums import MotorControllerState, SlewRate
-from .trajectory import Trajectory, accelerated_pos_and_vel
+from .trajectory import Trajectory
 
-# An angle of 180º.
-ONE_EIGHTY = Angle(180.0 * u.deg)
-# An angle of 360º.
-THREE_SIXTY = Angle(360.0 * u.deg)
-# Wrap angle for altitude.
-ALT_WRAP = ONE_EIGHTY
-# Wrap angle for azimuth.
-AZ_WRAP = THREE_SIXTY
+# An angle of 180º [deg].
+ONE_EIGHTY_DEG = 180.0
+# An angle of 360º [deg].
+THREE_SIXTY_DEG = 360.0
+# Wrap angle for altitude [deg].
+ALT_WRAP_DEG = ONE_EIGHTY_DEG
+# Wrap angle for azimuth [deg].
+AZ_WRAP_DEG = THREE_SIXTY_DEG
 
 
 class BaseMotorController(ABC):
@@ -45,6 +45,28 @@ class BaseMotorController(ABC):
       * Set the target position in steps and the maximum velocity in steps/sec in the physical motors.
     """
 
+    # Attributes are declared as slots to avoid a per-instance dict and to speed up attribute access in the
+    # callbacks and tracking code.
+    __slots__ = (
+        "name",
+        "is_alt",
+        "log",
+        "_position",
+        "_velocity",
+        "_max_velocity",
+        "_max_acceleration",
+        "_conversion_factor",
+        "_conv_deg",
+        "_inv_conv_deg",
+        "_position_offset",
+        "state",
+        "_one_eighty_steps",
+        "_three_sixty_steps",
+        "_wrap_hi_deg",
+        "_wrap_lo_deg",
+        "attached",
+    )
+
     # Name for altitude motors.
     ALT = "Alt"
     # Name for azimuth motors.
@@ -54,6 +76,7 @@ class BaseMotorController(ABC):
         self, log: logging.Logger, name: str, conversion_factor: Angle
     ) -> None:
         self.name = name
+        self.is_alt = name == BaseMotorController.ALT
         self.log = log.getChild(f"{type(self).__name__} {self.name}")
 
         self._position = 0.0
@@ -61,67 +84,102 @@ class BaseMotorController(ABC):
         self._max_velocity = 0.0
         self._max_acceleration = 0.0
         self._conversion_factor = conversion_factor
+        # The conversion factor [deg/step] and its reciprocal [step/deg] as plain floats, so conversions
+        # between steps and degrees don't need any astropy `Quantity` arithmetic.
+        self._conv_deg = float(conversion_factor.to_value(u.deg))
+        self._inv_conv_deg = 1.0 / self._conv_deg
         self.log.info(
-            f'Conversion factor set to {conversion_factor.deg}º == {conversion_factor.deg * 3600.0:.4f}".'
+            f'Conversion factor set to {self._conv_deg}º == {self._conv_deg * 3600.0:.4f}".'
         )
         self._position_offset = 0.0
         self.state = MotorControllerState.STOPPED
 
         # Some necessary constants that need to be computed once the conversion factor is known.
-        self._one_eighty_steps = (ONE_EIGHTY / self._conversion_factor).value
-        self._three_sixty_steps = (THREE_SIXTY / self._conversion_factor).value
+        self._one_eighty_steps = ONE_EIGHTY_DEG * self._inv_conv_deg
+        self._three_sixty_steps = THREE_SIXTY_DEG * self._inv_conv_deg
+
+        # Lower and upper bound [deg] of the range that the position gets wrapped into. The range always
+        # spans 360º.
+        self._wrap_hi_deg = ALT_WRAP_DEG if self.is_alt else AZ_WRAP_DEG
+        self._wrap_lo_deg = self._wrap_hi_deg - THREE_SIXTY_DEG
 
         self.attached = False
 
     @property
     def position(self) -> Angle:
         """The motor position [steps] as an astropy `Angle`."""
-        pos = (self._position + self._position_offset) * self._conversion_factor
-        return pos.wrap_at(
-            ALT_WRAP if self.name == BaseMotorController.ALT else AZ_WRAP
-        )
+        return Angle(self.position_deg, u.deg)
 
     @position.setter
     def position(self, position: Angle) -> None:
         """Setter for the motor position [astropy `Angle`] which gets converted to steps."""
-        position_value = (position / self._conversion_factor).value
+        position_value = position.to_value(u.deg) * self._inv_conv_deg
         self._position_offset = position_value - self._position
 
+    @property
+    def position_deg(self) -> float:
+        """The position of the motor [deg].
+
+        Use this instead of `position` when only the value in degrees is needed, to avoid creating an `Angle`.
+        """
+        pos_deg = (self._position + self._position_offset) * self._conv_deg
+        # The position hardly ever needs to be wrapped, so only do so when necessary.
+        if not self._wrap_lo_deg <= pos_deg < self._wrap_hi_deg:
+            pos_deg = (
+                pos_deg - self._wrap_lo_deg
+            ) % THREE_SIXTY_DEG + self._wrap_lo_deg
+        return pos_deg
+
     @property
     def velocity(self) -> Angle:
         """The motor velocity [steps/sec] as an astropy `Angle` per sec."""
-        return self._velocity * self._conversion_factor
+        return Angle(self._velocity * self._conv_deg, u.deg)
+
+    @property
+    def is_moving(self) -> bool:
+        """Whether the motor is moving, i.e. has a non-zero velocity.
+
+        This avoids the `Angle` construction and comparison of checking `velocity` directly.
+        """
+        return self._velocity != 0.0
 
     @property
     def max_velocity(self) -> Angle:
         """The motor maximum velocity [steps/sec] as an astropy `Angle` per sec."""
-        return self._max_velocity * self._conversion_factor
+        return Angle(self._max_velocity * self._conv_deg, u.deg)
 
     @property
     def max_acceleration(self) -> Angle:
         """The motor maximum acceleration [steps/sec^2] as an astropy `Angle` per sec^2."""
-        return self._max_acceleration * self._conversion_factor
+        return Angle(self._max_acceleration * self._conv_deg, u.deg)
 
-    def _get_target_position_in_steps(self, target_position: Angle) -> int:
-        """Get the target position in steps.
+    def _get_target_position_in_steps_from_deg(
+        self, target_position_deg: float
+    ) -> float:
+        """Get the target position in steps from a target position in degrees.
 
         This takes both the conversion factor and the position offset into account. The number of steps is
         increased or decreased to match the multiple of steps equivalent to 180 degrees of the motor position.
 
         Parameters
         ----------
-        target_position : `Angle`
-            The target position.
+        target_position_deg : `float`
+            The target position [deg].
 
         Returns
         -------
-        int
-            The targtet position [sec].
+        float
+            The target position [steps].
         """
-        diff = (target_position - self.position).wrap_at(ONE_EIGHTY)
-        diff_in_steps = (diff / self._conversion_factor).value
-        target_position_in_steps = self._position + diff_in_steps
-        return target_position_in_steps
+        target_position_in_steps = (
+            target_position_deg * self._inv_conv_deg - self._position_offset
+        )
+        # The difference gets wrapped so there is no need to wrap the current position first.
+        diff_in_steps = target_position_in_steps - self._position
+        diff_in_steps = (
+            diff_in_steps + self._one_eighty_steps
+        ) % self._three_sixty_steps - self._one_eighty_steps
+        return self._position + diff_in_steps
 
     def on_attach(self, _: typing.Any) -> None:
         """On attach callback."""
@@ -161,30 +219,24 @@ class BaseMotorController(ABC):
         """Stop the current motion.
 
         If currently moving, this will slow down the motion at the maximum acceleration until stopped. In
-        order to do this, the time to stop from the current velocity assuming the maximum acceleration is
-        computed. Based on that time, the resulting target position is computed. The target position and
-        maximum velocity then are passed on to the method that sets it in the physical motor.
+        order to do this, the distance needed to stop from the current velocity assuming the maximum
+        acceleration is computed. Based on that distance, the resulting target position is computed. The
+        target position and maximum velocity then are passed on to the method that sets it in the physical
+        motor.
 
         If already stopped then this will have no effect.
         """
         self.state = MotorControllerState.STOPPING
-        position_to_start_stopping = self._position
         max_velocity_in_steps = self._velocity
-        if max_velocity_in_steps >= 0:
-            accel = -self._max_acceleration
-        else:
-            accel = self._max_acceleration
-        time_needed_to_stop = abs(max_velocity_in_steps / accel)
-        target_position_in_steps, _ = accelerated_pos_and_vel(
-            position_to_start_stopping,
-            max_velocity_in_steps,
-            accel,
-            time_needed_to_stop,
+        # Decelerating from v at the maximum acceleration a takes |v|/a sec, during which the motor moves
+        # another v * |v| / (2 * a) steps.
+        stopping_distance = (
+            max_velocity_in_steps
+            * abs(max_velocity_in_steps)
+            / (2.0 * self._max_acceleration)
         )
-        target_position = (
-            target_position_in_steps + self._position_offset
-        ) * self._conversion_factor
-        target_position_in_steps = self._get_target_position_in_steps(target_position)
+        # The stop position is where the motor physically ends up, so it must not be wrapped.
+        target_position_in_steps = self._position + stopping_distance
 
         await self.set_target_position_and_velocity(
             target_position_in_steps, max_velocity_in_steps
@@ -203,8 +255,11 @@ class BaseMotorController(ABC):
             The slew rate to apply. This determines the maximnum speed at which a slew is performed. Defaults
             to HIGH, which is the highest rate.
         """
+        target_position_deg = target_position.to_value(u.deg)
         self.state = MotorControllerState.SLEWING
-        target_position_in_steps = self._get_target_position_in_steps(target_position)
+        target_position_in_steps = self._get_target_position_in_steps_from_deg(
+            target_position_deg
+        )
         max_velocity_in_steps = self._max_velocity * slew_rate / SlewRate.HIGH
 
         await self.set_target_position_and_velocity(
@@ -224,7 +279,10 @@ class BaseMotorController(ABC):
         timediff : `float`
             The amount of time to take to track to the target position.
         """
-        target_position_in_steps = self._get_target_position_in_steps(target_position)
+        target_position_deg = target_position.to_value(u.deg)
+        target_position_in_steps = self._get_target_position_in_steps_from_deg(
+            target_position_deg
+        )
         max_velocity_in_steps = (self._position - target_position_in_steps) / timediff
         await self.set_target_position_and_velocity(
             target_position_in_steps, max_velocity_in_steps
@@ -243,8 +301,11 @@ class BaseMotorController(ABC):
         float
             The estimated slew time to the target position.
         """
+        target_position_deg = target_position.to_value(u.deg)
         trajectory = Trajectory(max_acceleration=self._max_acceleration)
-        target_position_in_steps = self._get_target_position_in_steps(target_position)
+        target_position_in_steps = self._get_target_position_in_steps_from_deg(
+            target_position_deg
+        )
         trajectory.set_target_position_and_velocity(
             curr_pos=self._position,
             curr_vel=self._velocity,
@@ -256,12 +317,10 @@ class BaseMotorController(ABC):
     @abstractmethod
     async def connect(self) -> None:
         """Connect the stepper motor."""
-        raise NotImplementedError
 
     @abstractmethod
     async def disconnect(self) -> None:
         """Disconnect the stepper motor."""
-        raise NotImplementedError
 
     @abstractmethod
     async def set_target_position_and_velocity(
@@ -276,7 +335,6 @@ class BaseMotorController(ABC):
         max_velocity_in_steps : `float`
             The maximum velocity [steps/sec].
         """
-        raise NotImplementedError
 
     async def __aenter__(self) -> BaseMotorController:
         await self.connect()
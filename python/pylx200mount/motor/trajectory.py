@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class TrajectorySegment:
     """Segment of a trajectory.
 
@@ -62,6 +62,45 @@ def accelerated_pos_and_vel(
     return position, velocity
 
 
+def _largest_time_to_reach(
+    start_position: float, start_velocity: float, acceleration: float, position: float
+) -> float:
+    """Compute the largest time at which accelerated motion reaches the provided position.
+
+    This solves p = p0 + v0*t + a*t**2/2.0 for t using the closed-form quadratic formula.
+
+    Parameters
+    ----------
+    start_position : `float`
+        The position [any unit] at t = 0s.
+    start_velocity : `float`
+        The velocity [any unit/sec] at t = 0s.
+    acceleration : `float`
+        The acceleration [any unit/sec^2]. This should not be 0.
+    position : `float`
+        The position [any unit] to reach.
+
+    Returns
+    -------
+    `float`
+        The largest of the two solutions [s].
+
+    Notes
+    -----
+    If two solutions exist, the largest one is returned since the smallest one usually is negative, and we
+    are only interested in events in the future. Rounding errors may make the discriminant slightly negative
+    when there is exactly one solution, so it is clipped at 0.
+    """
+    discriminant = start_velocity * start_velocity - 2.0 * acceleration * (
+        start_position - position
+    )
+    sqrt_discriminant = math.sqrt(max(discriminant, 0.0))
+    return max(
+        (-start_velocity + sqrt_discriminant) / acceleration,
+        (-start_velocity - sqrt_discriminant) / acceleration,
+    )
+
+
 class Trajectory:
     """Class representing the trajectory.
 
@@ -79,8 +118,25 @@ class Trajectory:
     """
 
     def __init__(self, max_acceleration: float) -> None:
-        self.segments: list[TrajectorySegment] = []
+        self._segments: list[TrajectorySegment] = []
+        # The segments as an (S, 4) array for `evaluate`. It is built the first time it is needed after the
+        # segments have been set.
+        self._segment_array: np.ndarray | None = None
         self._max_acceleration = max_acceleration
+        self._inv_max_acceleration = 1.0 / max_acceleration
+
+    @property
+    def segments(self) -> list[TrajectorySegment]:
+        """The segments of the trajectory.
+
+        Assign a new list instead of modifying the list in place, so `evaluate` picks up the new segments.
+        """
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments: list[TrajectorySegment]) -> None:
+        self._segments = segments
+        self._segment_array = None
 
     def set_target_position_and_velocity(
         self,
@@ -116,6 +172,52 @@ class Trajectory:
 
         self.consolidate_segments()
 
+    def evaluate(self, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the positions and velocities along the trajectory for many times at once.
+
+        Parameters
+        ----------
+        times : `np.ndarray`
+            The times [s], relative to the start of the trajectory. Times before the start of the trajectory
+            are evaluated using the first segment.
+
+        Returns
+        -------
+        positions, velocities : `tuple`[`np.ndarray`]
+            The positions and velocities at the provided times.
+
+        Raises
+        ------
+        ValueError
+            In case the trajectory has no segments yet.
+        """
+        if self._segment_array is None:
+            if not self._segments:
+                raise ValueError("The trajectory has no segments to evaluate.")
+            self._segment_array = np.array(
+                [
+                    (
+                        segment.start_time,
+                        segment.start_position,
+                        segment.start_velocity,
+                        segment.acceleration,
+                    )
+                    for segment in self._segments
+                ]
+            )
+        segments = self._segment_array
+        start_times = segments[:, 0]
+        indices = np.clip(
+            np.searchsorted(start_times, times, side="right") - 1,
+            0,
+            len(segments) - 1,
+        )
+        _, start_positions, start_velocities, accelerations = segments[indices].T
+        dt = times - start_times[indices]
+        velocities = start_velocities + accelerations * dt
+        positions = start_positions + (velocities + start_velocities) * dt / 2.0
+        return positions, velocities
+
     def handle_target_same_as_pos(
         self,
         curr_pos: float,
@@ -148,13 +250,11 @@ class Trajectory:
             ]
         else:
             # We are where we need to be, but we are moving, so we need to slow down and then return here.
-            time_to_stop = abs(curr_vel / self._max_acceleration)
-            if curr_vel > 0.0:
-                max_vel = -max_velocity
-                accel = -self._max_acceleration
-            else:
-                max_vel = max_velocity
-                accel = self._max_acceleration
+            time_to_stop = abs(curr_vel) * self._inv_max_acceleration
+            # Accelerate against the current velocity to come to a stop first.
+            sign = -math.copysign(1.0, curr_vel)
+            max_vel = sign * max_velocity
+            accel = sign * self._max_acceleration
             pos_when_stopped, vel_when_stopped = accelerated_pos_and_vel(
                 curr_pos, curr_vel, accel, time_to_stop
             )
@@ -195,15 +295,11 @@ class Trajectory:
         max_velocity : `float`
             The maximum velocity [any unit/sec].
         """
-        sign_pos = math.copysign(1, target_position - curr_pos)
-        sign_vel = math.copysign(1, curr_vel)
+        sign_pos = math.copysign(1.0, target_position - curr_pos)
+        sign_vel = math.copysign(1.0, curr_vel)
         if sign_pos == sign_vel or math.isclose(curr_vel, 0.0):
-            if target_position > curr_pos:
-                max_vel = max_velocity
-                accel = self._max_acceleration
-            else:
-                max_vel = -max_velocity
-                accel = -self._max_acceleration
+            max_vel = sign_pos * max_velocity
+            accel = sign_pos * self._max_acceleration
             self.segments = self._determine_trajectory_segments(
                 start_time=0.0,
                 curr_pos=curr_pos,
@@ -213,13 +309,9 @@ class Trajectory:
                 accel=accel,
             )
         else:
-            time_to_stop = abs(curr_vel / self._max_acceleration)
-            if curr_vel > 0.0:
-                max_vel = -max_velocity
-                accel = -self._max_acceleration
-            else:
-                max_vel = max_velocity
-                accel = self._max_acceleration
+            time_to_stop = abs(curr_vel) * self._inv_max_acceleration
+            max_vel = -sign_vel * max_velocity
+            accel = -sign_vel * self._max_acceleration
             pos_when_stopped, vel_when_stopped = accelerated_pos_and_vel(
                 curr_pos, curr_vel, accel, time_to_stop
             )
@@ -250,8 +342,8 @@ class Trajectory:
     ) -> list[TrajectorySegment]:
         """Determine the trajectory segments.
 
-        First the segments are determined assuming that the maximum velocity can be reached. If then it turns
-        out that that isn't the case, the segments are determined again without reaching the maximum velocity.
+        First it is determined whether the maximum velocity can be reached. Depending on that, the segments
+        are determined with or without reaching the maximum velocity.
 
         Parameters
         ----------
@@ -273,25 +365,33 @@ class Trajectory:
         `list`[`TrajectorySegment`]
             The segments that form the entire trajectory.
         """
-        segments = self._determine_trajectory_segments_with_max_velocity(
-            start_time=start_time,
-            curr_pos=curr_pos,
-            curr_vel=curr_vel,
-            target_position=target_position,
-            max_vel=max_vel,
-            accel=accel,
+        # The distance that remains to be covered at the maximum velocity after accelerating from the current
+        # velocity to the maximum velocity, and before decelerating from the maximum velocity to 0. The
+        # maximum velocity can only be reached if this distance has the same sign as the maximum velocity.
+        # Note that max_vel and accel always have the same sign.
+        cruise_distance = (
+            target_position
+            - curr_pos
+            - (2.0 * max_vel * max_vel - curr_vel * curr_vel) / (2.0 * accel)
         )
 
-        if segments[2].start_time <= segments[1].start_time:
-            segments = self._determine_trajectory_segments_without_max_velocity(
+        if cruise_distance * max_vel > 0.0:
+            return self._determine_trajectory_segments_with_max_velocity(
                 start_time=start_time,
                 curr_pos=curr_pos,
                 curr_vel=curr_vel,
                 target_position=target_position,
+                max_vel=max_vel,
                 accel=accel,
             )
 
-        return segments
+        return self._determine_trajectory_segments_without_max_velocity(
+            start_time=start_time,
+            curr_pos=curr_pos,
+            curr_vel=curr_vel,
+            target_position=target_position,
+            accel=accel,
+        )
 
     def _determine_trajectory_segments_with_max_velocity(
         self,
@@ -409,13 +509,9 @@ class Trajectory:
             # Halfway between p_zero_speed and target is where the velocity needs to start decreasing.
             p_halfway = (p_zero_speed + target_position) / 2.0
 
-            # Compute the time of p_halfway using numpy.
+            # Compute the time of p_halfway.
             # p_halfway = p0 + v0*t + a*t**2/2.0 <=> (a/2.0)*t**2 + (v0)*t + (p0 - p_halfway) = 0
-            roots = np.roots([accel / 2.0, curr_vel, curr_pos - p_halfway])
-
-            # If more than one root is found, take the largest one since the smallest one is usually negative,
-            # and we are only interested in events in the future.
-            t0 = max(roots)
+            t0 = _largest_time_to_reach(curr_pos, curr_vel, accel, p_halfway)
 
             max_vel = curr_vel + t0 * accel
 
@@ -440,7 +536,7 @@ class Trajectory:
                 ),
             ]
         else:
-            time_needed_to_stop_from_v0 = abs(curr_vel / accel)
+            time_needed_to_stop_from_v0 = abs(curr_vel) * self._inv_max_acceleration
             position_to_start_stopping, _ = accelerated_pos_and_vel(
                 target_position, 0.0, -accel, time_needed_to_stop_from_v0
             )
@@ -448,15 +544,9 @@ class Trajectory:
             # Halfway between p_zero_speed and target is where the velocity needs to start decreasing.
             p_halfway = (position_to_start_stopping + curr_pos) / 2.0
 
-            # Compute the time of p_halfway using numpy.
+            # Compute the time of p_halfway.
             # p_halfway = p0 + v0*t + a*t**2/2.0 <=> (a/2.0)*t**2 + (v0)*t + (p0 - p_halfway) = 0
-            roots = np.roots([accel / 2.0, curr_vel, curr_pos - p_halfway])
-
-            # print(f"WOUTER {accel=}, {curr_vel=}, {curr_pos=}, {p_halfway=}, {roots=}")
-
-            # If more than one root is found, take the largest one since the smallest one is usually negative,
-            # and we are only interested in events in the future.
-            t0 = max(roots)
+            t0 = _largest_time_to_reach(curr_pos, curr_vel, accel, p_halfway)
 
             max_vel = curr_vel + t0 * accel
 
@@ -484,13 +574,11 @@ class Trajectory:
     def consolidate_segments(self) -> None:
         """Consolidate the segments.
 
-        Any segements that have the same acceleration as its predecessor is removed.
+        Any segements that have the same acceleration as its predecessor is removed. All accelerations are
+        either 0.0 or plus or minus the maximum acceleration, so they can be compared exactly.
         """
-        accel = self.segments[0].acceleration
-        indices_of_segments_to_remove: list[int] = []
-        for i in range(1, len(self.segments)):
-            if math.isclose(self.segments[i].acceleration, accel):
-                indices_of_segments_to_remove.append(i)
-                accel = self.segments[i].acceleration
-        for i in reversed(indices_of_segments_to_remove):
-            self.segments.pop(i)
+        segments = [self.segments[0]]
+        for segment in self.segments[1:]:
+            if segment.acceleration != segments[-1].acceleration:
+                segments.append(segment)
+        self.segments = segments
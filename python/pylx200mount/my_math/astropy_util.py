@@ -1,6 +1,7 @@
 __all__ = [
     "get_altaz_at_different_time",
     "get_altaz_from_radec",
+    "get_altaz_from_radec_batch",
     "get_radec_from_altaz",
     "get_skycoord_from_alt_az",
     "get_skycoord_from_ra_dec",
@@ -8,10 +9,14 @@ __all__ = [
 ]
 
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 from astropy import units as u
 from astropy.coordinates import FK5, AltAz, Angle, SkyCoord
+from astropy.time import Time
 
+from ..datetime_util import DatetimeUtil
 from ..observing_location import ObservingLocation
 
 DEFAULT_ATMOSPHERIC_PRESSURE = u.Quantity(101325.0 * u.Pa)
@@ -19,22 +24,63 @@ DEFAULT_TEMPERATURE = u.Quantity(-20.0 * u.deg_C)
 DEFAULT_RELATIVE_HUMIDITY = 0.01
 DEFAULT_WAVELENGTH = u.Quantity(0.550 * u.micron)
 
-_fk5 = FK5(equinox=datetime.now().astimezone())
+# The AltAz frame attributes that are the same for all AltAz coordinates.
+_ALTAZ_FRAME_KWARGS = dict(
+    pressure=DEFAULT_ATMOSPHERIC_PRESSURE,
+    temperature=DEFAULT_TEMPERATURE,
+    relative_humidity=DEFAULT_RELATIVE_HUMIDITY,
+    obswl=DEFAULT_WAVELENGTH,
+)
+
+# The Julian Date of the UNIX epoch and the number of seconds in a day, used to convert timestamps to JD.
+_UNIX_EPOCH_JD = 2440587.5
+_SECONDS_PER_DAY = 86400.0
+
+
+@lru_cache(maxsize=8)
+def _get_fk5(equinox_jd: int) -> FK5:
+    """Get the FK5 frame for the provided equinox.
+
+    Parameters
+    ----------
+    equinox_jd : `int`
+        The equinox as Julian Date, rounded down to the day.
+
+    Returns
+    -------
+    FK5
+        The FK5 frame.
+    """
+    return FK5(equinox=Time(equinox_jd, format="jd"))
+
+
+def _get_current_fk5() -> FK5:
+    """Get the FK5 frame for the current day.
+
+    The equinox only changes once per day, so the same frame is shared by all coordinates of a day and doesn't
+    go stale during an observing session.
+
+    Returns
+    -------
+    FK5
+        The FK5 frame.
+    """
+    return _get_fk5(
+        int(DatetimeUtil.get_timestamp() / _SECONDS_PER_DAY + _UNIX_EPOCH_JD)
+    )
 
 
 def get_skycoord_from_alt_az(
     alt: float, az: float, observing_location: ObservingLocation, timestamp: float
 ) -> SkyCoord:
     return SkyCoord(
-        alt=Angle(alt * u.deg),
-        az=Angle(az * u.deg),
+        alt=alt,
+        az=az,
+        unit=u.deg,
         frame="altaz",
         obstime=datetime.fromtimestamp(timestamp, observing_location.tz),
         location=observing_location.location,
-        pressure=DEFAULT_ATMOSPHERIC_PRESSURE,
-        temperature=DEFAULT_TEMPERATURE,
-        relative_humidity=DEFAULT_RELATIVE_HUMIDITY,
-        obswl=DEFAULT_WAVELENGTH,
+        **_ALTAZ_FRAME_KWARGS,
     )
 
 
@@ -62,22 +108,51 @@ def get_altaz_from_radec(
         AltAz(
             obstime=datetime.fromtimestamp(timestamp, observing_location.tz),
             location=observing_location.location,
-            pressure=DEFAULT_ATMOSPHERIC_PRESSURE,
-            temperature=DEFAULT_TEMPERATURE,
-            relative_humidity=DEFAULT_RELATIVE_HUMIDITY,
-            obswl=DEFAULT_WAVELENGTH,
+            **_ALTAZ_FRAME_KWARGS,
         )
     )
-    return get_skycoord_from_alt_az(
-        alt_az.alt.deg, alt_az.az.deg, observing_location, timestamp
+    # Wrap the AltAz frame that was just computed instead of building a new one. This drops the attributes,
+    # like the equinox, that SkyCoord carries along from the RaDec coordinates.
+    return SkyCoord(alt_az.frame)
+
+
+def get_altaz_from_radec_batch(
+    ra_dec: SkyCoord, observing_location: ObservingLocation, timestamps: np.ndarray
+) -> SkyCoord:
+    """Transform RaDec coordinates to AltAz coordinates for many timestamps at once.
+
+    All timestamps are transformed in a single call, which is much faster than transforming them one by one
+    with `get_altaz_from_radec`.
+
+    Parameters
+    ----------
+    ra_dec : `SkyCoord`
+        The RaDec coordinates to transform.
+    observing_location : `ObservingLocation`
+        The observing location.
+    timestamps : `np.ndarray`
+        The UNIX timestamps to compute the AltAz coordinates for.
+
+    Returns
+    -------
+    SkyCoord
+        The AltAz coordinates, one for each timestamp.
+    """
+    return ra_dec.transform_to(
+        AltAz(
+            obstime=Time(timestamps, format="unix"),
+            location=observing_location.location,
+            **_ALTAZ_FRAME_KWARGS,
+        )
     )
 
 
 def get_skycoord_from_ra_dec(ra: float, dec: float) -> SkyCoord:
     return SkyCoord(
-        ra=Angle(ra * u.deg),
-        dec=Angle(dec * u.deg),
-        frame=_fk5,
+        ra=ra,
+        dec=dec,
+        unit=u.deg,
+        frame=_get_current_fk5(),
     )
 
 
@@ -85,10 +160,10 @@ def get_skycoord_from_ra_dec_str(ra_str: str, dec_str: str) -> SkyCoord:
     return SkyCoord(
         ra=Angle(ra_str + " hours"),
         dec=Angle(dec_str.replace("*", ":") + " degrees"),
-        frame=_fk5,
+        frame=_get_current_fk5(),
     )
 
 
 def get_radec_from_altaz(alt_az: SkyCoord) -> SkyCoord:
-    ra_dec = alt_az.transform_to(_fk5)
+    ra_dec = alt_az.transform_to(_get_current_fk5())
     return get_skycoord_from_ra_dec(ra_dec.ra.deg, ra_dec.dec.deg)
@@ -1,10 +1,33 @@
 __all__ = ["ObservingLocation"]
 
+import typing
+
 from astropy import units as u
 from astropy.coordinates import EarthLocation, Latitude, Longitude
 from astropy.time import TimezoneInfo
 
 
+class _Geodetic(typing.NamedTuple):
+    """The geodetic components of an observing location."""
+
+    lon: Longitude
+    lat: Latitude
+    height: u.Quantity | float
+
+
+# The default location. `EarthLocation` instances are never modified, so all `ObservingLocation` instances can
+# share this one instead of converting the geodetic coordinates every time.
+DEFAULT_GEODETIC = _Geodetic(
+    lon=Longitude("-3d53m06.3s"),
+    lat=Latitude("40d30m04.7s"),
+    height=710.0 * u.meter,
+)
+DEFAULT_LOCATION = EarthLocation.from_geodetic(*DEFAULT_GEODETIC)
+# The default timezone. Creating a `TimezoneInfo` involves several `Quantity` conversions, so share one
+# instance as well.
+DEFAULT_TIMEZONE = TimezoneInfo(tzname="CET")
+
+
 class ObservingLocation:
     """
     The obsering observing_location. It contains an `astropy.coordinates.EarthLocation`
@@ -16,65 +39,81 @@ class ObservingLocation:
     def __init__(
         self,
     ) -> None:
-        # Variables holding the site information
-        self.location: EarthLocation = EarthLocation.from_geodetic(
-            lon=Longitude("-3d53m06.3s"),
-            lat=Latitude("40d30m04.7s"),
-            height=710.0 * u.meter,
-        )
+        # Variables holding the site information. The `EarthLocation` and its geodetic
+        # components are both computed lazily from each other, since converting
+        # between them is expensive.
+        self._location: EarthLocation | None = DEFAULT_LOCATION
+        self._geodetic: _Geodetic | None = DEFAULT_GEODETIC
         self.name: str = "Las Rozas de Madrid"
-        self.tz: TimezoneInfo = TimezoneInfo(tzname="CET")
+        self.tz: TimezoneInfo = DEFAULT_TIMEZONE
+
+    @property
+    def location(self) -> EarthLocation:
+        """The `astropy.coordinates.EarthLocation` of the ObservingLocation."""
+        if self._location is None:
+            assert self._geodetic is not None
+            self._location = EarthLocation.from_geodetic(*self._geodetic)
+        return self._location
+
+    @location.setter
+    def location(self, location: EarthLocation) -> None:
+        self._location = location
+        self._geodetic = None
+
+    def _get_geodetic(self) -> _Geodetic:
+        """Get the geodetic components of the ObservingLocation.
+
+        Returns
+        -------
+        _Geodetic
+            The longitude, latitude and height.
+        """
+        if self._geodetic is None:
+            location = self.location
+            self._geodetic = _Geodetic(location.lon, location.lat, location.height)
+        return self._geodetic
 
     def set_longitude(self, longitude: Longitude) -> None:
         """
         Set the longitude of the ObservingLocation. It will create a new
         `astropy.coordinates.EarthLocation` instance with the new value of longitude
-        while copying the other values.
+        while copying the other values, the next time the location is accessed.
 
         Parameters
         ----------
         longitude: `Longitude`
             The new longitude
         """
-        self.location = EarthLocation.from_geodetic(
-            lon=longitude,
-            lat=self.location.lat,
-            height=self.location.height,
-        )
+        self._geodetic = self._get_geodetic()._replace(lon=longitude)
+        self._location = None
 
     def set_latitude(self, latitude: Latitude) -> None:
         """
         Set the latitude of the ObservingLocation. It will create a new
         `astropy.coordinates.EarthLocation` instance with the new value of latitude
-        while copying the other values.
+        while copying the other values, the next time the location is accessed.
 
         Parameters
         ----------
         latitude: `Latitude`
             The new latitude
         """
-        self.location = EarthLocation.from_geodetic(
-            lon=self.location.lon,
-            lat=latitude,
-            height=self.location.height,
-        )
+        self._geodetic = self._get_geodetic()._replace(lat=latitude)
+        self._location = None
 
     def set_height(self, height: float) -> None:
         """
         Set the height of the ObservingLocation. It will create a new
         `astropy.coordinates.EarthLocation` instance with the new value of latitude
-        while copying the other values.
+        while copying the other values, the next time the location is accessed.
 
         Parameters
         ----------
         height: `float`
             The new height in `u.meter`
         """
-        self.location = EarthLocation.from_geodetic(
-            lon=self.location.lon,
-            lat=self.location.lat,
-            height=height,
-        )
+        self._geodetic = self._get_geodetic()._replace(height=height)
+        self._location = None
 
     def set_name(self, name: str) -> None:
         """
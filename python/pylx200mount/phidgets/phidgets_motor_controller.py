@@ -1,16 +1,38 @@
 __all__ = ["PhidgetsMotorController"]
 
 import logging
+import typing
 
 from astropy.coordinates import Angle
 
 from ..motor.base_motor_controller import BaseMotorController
 
+# Import the Phidgets22 module only once. Without it, the Phidgets motor controller cannot be used.
+try:
+    from Phidget22.Devices.Stepper import Stepper
+    from Phidget22.Net import Net, PhidgetServerType
+    from Phidget22.PhidgetException import PhidgetException
+
+    HAS_PHIDGETS = True
+except ImportError:
+    HAS_PHIDGETS = False
+
 # The maximum acceleration of the stepper motor [deg/sec].
 ACCELERATION = 60000
 # Time to wait for the stepper motor to report that it is attached.
 ATTACH_WAIT_TIME = 2000
 
+# Server discovery only needs to be enabled once per process.
+_server_discovery_enabled = False
+
+
+def _enable_server_discovery() -> None:
+    """Enable discovery of remote Phidgets servers, unless that already was done."""
+    global _server_discovery_enabled
+    if not _server_discovery_enabled:
+        Net.enableServerDiscovery(PhidgetServerType.PHIDGETSERVER_DEVICEREMOTE)
+        _server_discovery_enabled = True
+
 
 class PhidgetsMotorController(BaseMotorController):
     """Phidgets motor controller.
@@ -18,6 +40,8 @@ class PhidgetsMotorController(BaseMotorController):
     See `BaseMotorController`.
     """
 
+    __slots__ = ("stepper",)
+
     def __init__(
         self,
         initial_position: Angle,
@@ -26,20 +50,16 @@ class PhidgetsMotorController(BaseMotorController):
         hub_port: int,
         is_remote: bool = True,
     ) -> None:
-        name = "Alt" if hub_port == 0 else "Az"
+        name = BaseMotorController.ALT if hub_port == 0 else BaseMotorController.AZ
         super().__init__(log=log, name=name, conversion_factor=conversion_factor)
 
-        try:
-            from Phidget22.Devices.Stepper import Stepper
-            from Phidget22.Net import Net, PhidgetServerType
-            from Phidget22.PhidgetException import PhidgetException  # noqa
-        except ImportError:
-            self.log.warn(
-                "Couldn't import the Phidgets22 module. Continuing without Phidgets support."
+        if not HAS_PHIDGETS:
+            raise ImportError(
+                "Couldn't import the Phidgets22 module so Phidgets motors are not supported."
             )
 
         if is_remote:
-            Net.enableServerDiscovery(PhidgetServerType.PHIDGETSERVER_DEVICEREMOTE)
+            _enable_server_discovery()
 
         self._max_velocity = ACCELERATION
         self._max_acceleration = ACCELERATION
@@ -53,18 +73,27 @@ class PhidgetsMotorController(BaseMotorController):
         self.stepper.setOnVelocityChangeHandler(self.on_velocity_change)
         self.stepper.setOnErrorHandler(self.on_error)
 
-        self._position_offset = round(
-            (initial_position / self._conversion_factor).value
-        )
+        self.position = initial_position
+
+    def on_error(self, _: typing.Any, code: int, description: str) -> None:
+        """On error callback.
 
-    def on_error(self, code: int, description: str) -> None:
-        self.log.error(f"{code=!s} -> {description=!s}")
+        Parameters
+        ----------
+        _: `typing.Any`
+            An instance of the stepper class.
+        code: `int`
+            The error code.
+        description: `str`
+            The error description.
+        """
+        self.log.error("code=%s -> description=%s", code, description)
 
     async def connect(self) -> None:
         """Connect the stepper motor."""
         try:
             self.stepper.openWaitForAttachment(ATTACH_WAIT_TIME)
-        except PhidgetException as e:  # type: ignore  # noqa
+        except PhidgetException as e:
             raise RuntimeError(e)
         assert self.attached
         self.stepper.setEngaged(True)
@@ -89,6 +118,5 @@ class PhidgetsMotorController(BaseMotorController):
         max_velocity_in_steps : `float`
             The maximum velocity [steps/sec].
         """
-        assert self.stepper is not None
         self.stepper.setVelocityLimit(abs(max_velocity_in_steps))
         self.stepper.setTargetPosition(target_position_in_steps)
@@ -3,8 +3,8 @@ __all__ = ["BasePlateSolver"]
 import abc
 import logging
 
+import numpy as np
 from astropy.coordinates import SkyCoord  # type: ignore
-from PIL import Image
 
 from ..camera import BaseCamera
 
@@ -28,17 +28,16 @@ class BasePlateSolver(abc.ABC):
         """Instruct the camera to start imaging."""
         await self.camera.start_imaging()
 
-    async def get_image(self) -> Image.Image:
+    async def get_image(self) -> np.ndarray:
         """Get the latest image from the camera.
 
         Returns
         -------
-        Image
-            The image taken with the camera in PIL Image format.
+        np.ndarray
+            The image taken with the camera. It is not wrapped in a PIL Image since the solver works on
+            arrays anyway.
         """
-        data = await self.camera.get_image()
-        img = Image.fromarray(data)
-        return img
+        return await self.camera.get_image()
 
     async def stop_imaging(self) -> None:
         """Instruct the camera to stop imaging."""
@@ -58,4 +57,3 @@ class BasePlateSolver(abc.ABC):
         RuntimeError
             In case no image can be taken or solving it fails.
         """
-        raise NotImplementedError
@@ -2,11 +2,12 @@ __all__ = ["PlateSolver"]
 
 import asyncio
 import logging
-import math
+import time
+from functools import lru_cache
 
+import numpy as np
 import tetra3  # type: ignore
 from astropy.coordinates import SkyCoord  # type: ignore
-from PIL import Image
 
 from ..camera import BaseCamera
 from ..datetime_util import DatetimeUtil
@@ -19,6 +20,28 @@ FOV_FACTOR = 202.265 / 60 / 60
 
 # Solver timout [s].
 SOLVER_TIMEOUT = 0.25
+# The tetra3 star pattern database to use.
+DATABASE_NAME = "asi120mm_database"
+
+
+@lru_cache(maxsize=4)
+def _get_tetra3(database_name: str) -> tetra3.Tetra3:
+    """Get a tetra3 instance with the provided database loaded.
+
+    Loading the database is expensive, so the instance is shared by all `PlateSolver` instances, for instance
+    the ones created when the mount controller is restarted.
+
+    Parameters
+    ----------
+    database_name : `str`
+        The name of the database to load.
+
+    Returns
+    -------
+    tetra3.Tetra3
+        The tetra3 instance.
+    """
+    return tetra3.Tetra3(load_database=database_name)
 
 
 class PlateSolver(BasePlateSolver):
@@ -31,13 +54,32 @@ class PlateSolver(BasePlateSolver):
         log: logging.Logger,
     ) -> None:
         super().__init__(camera=camera, focal_length=focal_length, log=log)
-        self.t3 = tetra3.Tetra3(load_database="asi120mm_database")
+        self.t3 = _get_tetra3(DATABASE_NAME)
 
         self.center = get_skycoord_from_ra_dec(0.0, 0.0)
         self.previous_center = self.center
 
         self.fov_estimate = 0.0
 
+    async def open_camera(self) -> None:
+        """Open the camera and estimate the field of view from its geometry.
+
+        The camera geometry only is known once the camera has been opened.
+        """
+        await super().open_camera()
+        # Estimate of the size of the field of view [deg].
+        min_img_size = min(self.camera.img_width, self.camera.img_height)
+        self.fov_estimate = (
+            min_img_size * self.camera.pixel_size * FOV_FACTOR / self.focal_length
+        )
+        self.log.info(
+            "img_width=%s, img_height=%s, focal_length=%s, fov_estimate=%s",
+            self.camera.img_width,
+            self.camera.img_height,
+            self.focal_length,
+            self.fov_estimate,
+        )
+
     async def solve(self) -> SkyCoord:
         """Take an image and solve it.
 
@@ -53,49 +95,50 @@ class PlateSolver(BasePlateSolver):
         """
         self.log.debug("Start solve.")
         start = DatetimeUtil.get_timestamp()
-        if math.isclose(self.fov_estimate, 0.0):
-            # Estimate of the size of the field of view [deg].
-            min_img_size = min(self.camera.img_width, self.camera.img_height)
-            self.fov_estimate = (
-                min_img_size * self.camera.pixel_size * FOV_FACTOR / self.focal_length
-            )
-            self.log.info(
-                f"{self.camera.img_width=}, {self.camera.img_height=}, {self.focal_length=}"
-            )
-
-        self.log.debug(f"{self.fov_estimate=}")
+        self.log.debug("self.fov_estimate=%s", self.fov_estimate)
 
         img_start = DatetimeUtil.get_timestamp()
         img = await self.get_image()
         img_end = DatetimeUtil.get_timestamp()
-        self.log.debug(f"Async get_image took {img_end - img_start} s.")
+        self.log.debug("Async get_image took %s s.", img_end - img_start)
+        # Save the previous center here, so a timed out solve that still runs in the executor can't change it.
+        self.previous_center = self.center
         try:
             loop = asyncio.get_running_loop()
+            # Use the monotonic clock, since the DatetimeUtil time can be changed by the planetarium software.
+            deadline = time.monotonic() + SOLVER_TIMEOUT
             await asyncio.wait_for(
-                loop.run_in_executor(None, self._blocking_solve, img),
+                loop.run_in_executor(None, self._blocking_solve, img, deadline),
                 timeout=SOLVER_TIMEOUT,
             )
         except Exception:
             self.center = self.previous_center
         finally:
             end = DatetimeUtil.get_timestamp()
-            self.log.debug(f"Solving took {end - start} s.")
+            self.log.debug("Solving took %s s.", end - start)
         return self.center
 
-    def _blocking_solve(self, img: Image.Image) -> None:
-        self.previous_center = self.center
+    def _blocking_solve(self, img: np.ndarray, deadline: float) -> None:
         start = DatetimeUtil.get_timestamp()
         centroids = tetra3.get_centroids_from_image(image=img)
         end = DatetimeUtil.get_timestamp()
-        self.log.debug(f"Centroids {end - start} s.")
+        self.log.debug("Centroids %s s.", end - start)
+        if time.monotonic() > deadline:
+            # The solve already has timed out, so don't keep the executor busy with pattern matching and don't
+            # overwrite the center with a stale result.
+            raise TimeoutError("Plate solving timed out while finding centroids.")
         start = DatetimeUtil.get_timestamp()
         result = self.t3.solve_from_centroids(
             centroids,
-            (img.width, img.height),
+            (img.shape[1], img.shape[0]),
             fov_estimate=self.fov_estimate,
             fov_max_error=FOV_MAX_ERROR,
         )
         end = DatetimeUtil.get_timestamp()
-        self.log.debug(f"Solve from centroids took {end - start} s.")
+        self.log.debug("Solve from centroids took %s s.", end - start)
+        if time.monotonic() > deadline:
+            # The solve timed out while matching patterns and solve() already fell back to the previous
+            # center, so don't overwrite it with a stale result.
+            raise TimeoutError("Plate solving timed out while matching patterns.")
         self.center = get_skycoord_from_ra_dec(result["RA"], result["Dec"])
         self.fov_estimate = result["FOV"]
@@ -2,7 +2,34 @@ import logging
 import pathlib
 from unittest import IsolatedAsyncioTestCase, mock
 
+import astropy.units as u
 import pylx200mount
+import pytest
+from astropy.coordinates import Angle
+
+lx200_command_reponder = pylx200mount.controller.lx200_command_reponder
+
+# Values [deg] to compare the LX200 formatting with `Angle.to_string` for. They contain negative values and
+# values for which the rounding of the seconds or minutes carries over.
+FORMATTING_VALUES = [
+    0.0,
+    -0.5,
+    -5.25,
+    -29.9,
+    10.0 + 30.0 / 60.0 + 59.7 / 3600.0,
+    10.0 + 59.0 / 60.0 + 59.8 / 3600.0,
+    -(45.0 + 59.0 / 60.0 + 59.9 / 3600.0),
+    -(8.0 + 59.6 / 60.0),
+    359.9999,
+]
+
+
+def format_sexagesimal(value: float, resolution: float) -> str:
+    sign, whole, minutes, seconds = lx200_command_reponder.get_sexagesimal(
+        value, resolution
+    )
+    sign_str = "-" if sign < 0.0 else ""
+    return f"{sign_str}{whole:02.0f}:{minutes:02.0f}:{seconds:02.0f}"
 
 
 class TestLx200CommandResponder(IsolatedAsyncioTestCase):
@@ -113,6 +140,18 @@ class TestLx200CommandResponder(IsolatedAsyncioTestCase):
         )
         self.assertDoesNotEndInHash(current_site_longitude)
 
+    async def test_current_site_latitude_reply_after_set(self) -> None:
+        await self.responder.set_current_site_latitude("-29*56")
+        assert await self.responder.get_current_site_latitude() == "-29*56#"
+        await self.responder.set_current_site_latitude("52*30")
+        assert await self.responder.get_current_site_latitude() == "52*30#"
+
+    async def test_current_site_longitude_reply_after_set(self) -> None:
+        await self.responder.set_current_site_longitude("071*14")
+        assert await self.responder.get_current_site_longitude() == "71:14#"
+        await self.responder.set_current_site_longitude("-005*30")
+        assert await self.responder.get_current_site_longitude() == "-5:30#"
+
     async def test_get_site_1_name(self) -> None:
         site_1_name = await self.responder.get_site_1_name()
         self.assertEndsInHash(site_1_name)
@@ -131,3 +170,78 @@ class TestLx200CommandResponder(IsolatedAsyncioTestCase):
         assert reply == "1"
         reply = await self.responder.set_local_date("02/02/22")
         assert reply[0] == "1"
+
+
+class TestLx200Formatting(IsolatedAsyncioTestCase):
+    async def test_get_sexagesimal_degrees(self) -> None:
+        for value in FORMATTING_VALUES:
+            expected = Angle(value, u.deg).to_string(
+                unit=u.deg, sep=":", precision=0, pad=True
+            )
+            assert format_sexagesimal(value, 1.0) == expected, value
+
+    async def test_get_ra_as_lx200_string(self) -> None:
+        for value in FORMATTING_VALUES:
+            ra = Angle(abs(value), u.deg)
+            ra_str = await lx200_command_reponder.get_ra_as_lx200_string(
+                ra=ra, coordinate_precision=pylx200mount.enums.CoordinatePrecision.HIGH
+            )
+            if value == 359.9999:
+                # Rounding carries over to 24h, which wraps around to 0h.
+                assert ra_str == "00:00:00"
+                ra_str = await lx200_command_reponder.get_ra_as_lx200_string(
+                    ra=ra,
+                    coordinate_precision=pylx200mount.enums.CoordinatePrecision.LOW,
+                )
+                assert ra_str == "00:00.0"
+            else:
+                expected = ra.to_string(
+                    unit=u.hourangle, sep=":", precision=0, pad=True
+                )
+                assert ra_str == expected, value
+
+    async def test_get_angle_as_lx200_string(self) -> None:
+        for value in FORMATTING_VALUES:
+            angle = Angle(value, u.deg)
+            d, m, s = angle.to_string(unit=u.deg, sep=":", precision=0, pad=True).split(
+                ":"
+            )
+            angle_str = await lx200_command_reponder.get_angle_as_lx200_string(
+                angle=angle,
+                digits=2,
+                coordinate_precision=pylx200mount.enums.CoordinatePrecision.HIGH,
+            )
+            assert angle_str == f"{d}*{m}'{s}", value
+
+            d, m = angle.to_string(unit=u.deg, sep=":", fields=2, pad=True).split(":")
+            angle_str = await lx200_command_reponder.get_angle_as_lx200_string(
+                angle=angle,
+                digits=2,
+                coordinate_precision=pylx200mount.enums.CoordinatePrecision.LOW,
+            )
+            assert angle_str == f"{d}*{m}", value
+
+
+class TestLx200Parsing(IsolatedAsyncioTestCase):
+    async def test_get_degrees_from_deg_min(self) -> None:
+        assert lx200_command_reponder.get_degrees_from_deg_min("-00*30") == -0.5
+        assert lx200_command_reponder.get_degrees_from_deg_min("45*00") == 45.0
+        assert lx200_command_reponder.get_degrees_from_deg_min(
+            "120*15"
+        ) == pytest.approx(120.25)
+        assert lx200_command_reponder.get_degrees_from_deg_min(
+            "-120*15"
+        ) == pytest.approx(-120.25)
+
+    async def test_parse_lx200_latitude(self) -> None:
+        latitude = lx200_command_reponder.parse_lx200_latitude("-00*30")
+        assert latitude.deg == pytest.approx(-0.5)
+        latitude = lx200_command_reponder.parse_lx200_latitude("45*00")
+        assert latitude.deg == pytest.approx(45.0)
+
+    async def test_parse_lx200_longitude(self) -> None:
+        # LX200 longitudes are positive to the West, astropy longitudes to the East.
+        longitude = lx200_command_reponder.parse_lx200_longitude("120*15")
+        assert longitude.wrap_at(180.0 * u.deg).deg == pytest.approx(-120.25)
+        longitude = lx200_command_reponder.parse_lx200_longitude("-120*15")
+        assert longitude.wrap_at(180.0 * u.deg).deg == pytest.approx(120.25)
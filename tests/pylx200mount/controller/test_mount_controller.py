@@ -66,3 +66,23 @@ class TestMountController(IsolatedAsyncioTestCase):
 
     async def test_slew_down(self) -> None:
         await self.mount_controller.slew_in_direction("Ms")
+
+    async def test_get_ra_dec_refreshes(self) -> None:
+        # Make sure that only this test updates the mount AltAz.
+        self.mount_controller.should_run_plate_solve_loop = False
+
+        ra_dec = await self.mount_controller.get_ra_dec()
+        assert await self.mount_controller.get_ra_dec() is ra_dec
+
+        self.mount_controller.mount_alt_az = (
+            pylx200mount.my_math.get_skycoord_from_alt_az(
+                alt=60.0,
+                az=200.0,
+                observing_location=self.mount_controller.observing_location,
+                timestamp=pylx200mount.DatetimeUtil.get_timestamp(),
+            )
+        )
+
+        new_ra_dec = await self.mount_controller.get_ra_dec()
+        assert new_ra_dec is not ra_dec
+        assert new_ra_dec.separation(ra_dec).deg > 1.0
@@ -69,6 +69,69 @@ class TestTrajectory(IsolatedAsyncioTestCase):
             curr_pos=10000.0, curr_vel=-100000.0, target_position=10000.0
         )
 
+    async def test_consolidate_segments(self) -> None:
+        self.trajectory = pylx200mount.motor.Trajectory(max_acceleration=50000.0)
+        for accelerations, expected_accelerations in [
+            ([1.0, 1.0, 0.0, -1.0, 0.0], [1.0, 0.0, -1.0, 0.0]),
+            ([1.0, 0.0, 0.0], [1.0, 0.0]),
+            ([1.0, 0.0, 1.0], [1.0, 0.0, 1.0]),
+        ]:
+            self.trajectory.segments = [
+                pylx200mount.motor.TrajectorySegment(
+                    start_time=float(i),
+                    start_position=0.0,
+                    start_velocity=0.0,
+                    acceleration=acceleration,
+                )
+                for i, acceleration in enumerate(accelerations)
+            ]
+            self.trajectory.consolidate_segments()
+            assert [
+                segment.acceleration for segment in self.trajectory.segments
+            ] == expected_accelerations
+
+    async def test_evaluate(self) -> None:
+        self.trajectory = pylx200mount.motor.Trajectory(max_acceleration=50000.0)
+        self.trajectory.set_target_position_and_velocity(
+            curr_pos=90000.0,
+            curr_vel=-50000.0,
+            target_position=1000000.0,
+            max_velocity=100000.0,
+        )
+        end_time = self.trajectory.segments[-1].start_time
+        times = numpy.linspace(0.0, end_time + 1.0, 101)
+        positions, velocities = self.trajectory.evaluate(times)
+        for time, position, velocity in zip(times, positions, velocities):
+            segment = [s for s in self.trajectory.segments if s.start_time <= time][-1]
+            expected_pos, expected_vel = pylx200mount.motor.accelerated_pos_and_vel(
+                segment.start_position,
+                segment.start_velocity,
+                segment.acceleration,
+                time - segment.start_time,
+            )
+            assert position == pytest.approx(expected_pos)
+            assert velocity == pytest.approx(expected_vel)
+        assert positions[-1] == pytest.approx(1000000.0)
+        assert velocities[-1] == pytest.approx(0.0)
+
+    async def test_evaluate_new_target(self) -> None:
+        self.trajectory = pylx200mount.motor.Trajectory(max_acceleration=50000.0)
+        with pytest.raises(ValueError):
+            self.trajectory.evaluate(numpy.array([0.0]))
+
+        times = numpy.array([0.0, 1000.0])
+        for target_position in [1000000.0, -500000.0]:
+            self.trajectory.set_target_position_and_velocity(
+                curr_pos=0.0,
+                curr_vel=0.0,
+                target_position=target_position,
+                max_velocity=100000.0,
+            )
+            positions, velocities = self.trajectory.evaluate(times)
+            assert positions[0] == pytest.approx(0.0)
+            assert positions[-1] == pytest.approx(target_position)
+            assert velocities[-1] == pytest.approx(0.0)
+
     def assert_trajectory(
         self, curr_pos: float, curr_vel: float, target_position: float
     ) -> None:
@@ -0,0 +1,30 @@
+import unittest
+
+import numpy as np
+import pylx200mount
+import pytest
+
+
+class TestAstropyUtil(unittest.IsolatedAsyncioTestCase):
+    async def test_get_altaz_from_radec_batch(self) -> None:
+        observing_location = pylx200mount.observing_location.ObservingLocation()
+        now = pylx200mount.DatetimeUtil.get_timestamp()
+        timestamps = now + np.array([0.0, 60.0, 3600.0, 7200.5])
+
+        for ra, dec in [(0.0, 0.0), (123.4, 45.6), (250.0, -20.0), (10.0, 89.0)]:
+            ra_dec = pylx200mount.my_math.get_skycoord_from_ra_dec(ra=ra, dec=dec)
+            alt_az = pylx200mount.my_math.get_altaz_from_radec_batch(
+                ra_dec=ra_dec,
+                observing_location=observing_location,
+                timestamps=timestamps,
+            )
+            assert len(alt_az) == len(timestamps)
+
+            for i, timestamp in enumerate(timestamps):
+                expected = pylx200mount.my_math.get_altaz_from_radec(
+                    ra_dec=ra_dec,
+                    observing_location=observing_location,
+                    timestamp=float(timestamp),
+                )
+                assert alt_az[i].alt.deg == pytest.approx(expected.alt.deg, abs=1e-6)
+                assert alt_az[i].az.deg == pytest.approx(expected.az.deg, abs=1e-6)